@@ -0,0 +1,96 @@
+from argparse import ArgumentParser
+from array import array
+from os.path import abspath, dirname, exists
+import os
+import struct
+import sys
+from time import time
+from typing import List
+
+# PrimeStore.py lives in the repository root
+sys.path.append(dirname(dirname(abspath(__file__))))
+from PrimeStore import PrimeStore
+from PythonVersionB import is_a_square, is_prime
+
+# A checkpoint is two files. path holds the search state: a header (magic,
+# format version, odd frontier, number of primes, prime-store watermark in
+# bytes, number of failures) followed by the failures as 8 byte ints. It is
+# rewritten to a temporary file and renamed over the old one, so it is never
+# half written. path + '.primes' holds the PrimeStore gap bytes and is only
+# ever appended to; the watermark says how much of it the state covers, so
+# anything written after the last checkpoint is ignored on resume.
+MAGIC = b'GBCP'
+VERSION = 1
+HEADER = struct.Struct('<4sIQQQQ')
+
+# Odd numbers checked between looks at the clock
+CLOCK_EVERY = 1 << 12
+
+def save_checkpoint(path: str, frontier: int, primes: PrimeStore, watermark: int, fails: List[int]) -> int:
+    with open(path + '.primes', 'ab') as f:
+        f.write(primes.gaps[watermark:])
+        f.flush()
+        os.fsync(f.fileno())
+    watermark = len(primes.gaps)
+    with open(path + '.tmp', 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, frontier, len(primes), watermark, len(fails)))
+        f.write(array('Q', fails).tobytes())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(path + '.tmp', path)
+    return watermark
+
+def load_checkpoint(path: str):
+    with open(path, 'rb') as f:
+        magic, version, frontier, prime_count, watermark, fail_count = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{path} is not a version {VERSION} Goldbach checkpoint')
+        fails = array('Q', f.read(8 * fail_count)).tolist()
+    # drop any primes appended after the last checkpoint was completed
+    os.truncate(path + '.primes', watermark)
+    with open(path + '.primes', 'rb') as f:
+        primes = PrimeStore.from_gaps(f.read())
+    if len(primes) != prime_count:
+        raise ValueError(f'{path}.primes holds {len(primes)} primes, expected {prime_count}')
+    return frontier, primes, watermark, fails
+
+# PythonVersionB.goldbach_fails, checkpointed to path every interval seconds.
+# With resume, it picks up from the last checkpoint (the primes found so far
+# are read back, not recomputed); otherwise it starts over. The clock is only
+# read every CLOCK_EVERY odd numbers, and a checkpoint only appends the new
+# primes, so the overhead stays far below 1% of the run.
+def goldbach_fails(bound: int, path: str, interval: float = 300.0, resume: bool = False) -> [int]:
+    if resume and exists(path):
+        oddNumber, primes, watermark, fails = load_checkpoint(path)
+    else:
+        oddNumber, primes, fails = 3, PrimeStore([2]), []
+        # checkpoint the empty search right away, so a stale state file from
+        # an earlier run never describes the new primes file
+        open(path + '.primes', 'wb').close()
+        watermark = save_checkpoint(path, oddNumber, primes, 0, fails)
+    last_save = time()
+
+    while len(fails) < bound:
+        if is_prime(oddNumber):
+            primes.append(oddNumber)
+        else:
+            for prime in primes:
+                if is_a_square(((oddNumber-prime)//2)):
+                    break
+            else:
+                fails.append(oddNumber)
+        oddNumber += 2
+        if oddNumber % CLOCK_EVERY == 1 and time() - last_save >= interval:
+            watermark = save_checkpoint(path, oddNumber, primes, watermark, fails)
+            last_save = time()
+    save_checkpoint(path, oddNumber, primes, watermark, fails)
+    return fails
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description="Checkpointed search for counterexamples to Goldbach's other conjecture.")
+    parser.add_argument('bound', type=int, help='number of failures to find')
+    parser.add_argument('checkpoint', help='checkpoint file (the primes go next to it in CHECKPOINT.primes)')
+    parser.add_argument('--resume', action='store_true', help='continue from the last checkpoint')
+    parser.add_argument('--interval', type=float, default=300.0, help='seconds between checkpoints')
+    args = parser.parse_args()
+    print("Goldbach failures: ", goldbach_fails(args.bound, args.checkpoint, args.interval, args.resume))
@@ -0,0 +1,48 @@
+import sys
+from time import perf_counter
+from typing import Callable, NamedTuple, Optional
+
+# How often (in odd numbers) the search loops hand their counters over. The
+# clock is only read then, so an attached Progress costs next to nothing.
+CHECK_EVERY = 1 << 10
+
+class ProgressReport(NamedTuple):
+    checked: int            # odd numbers looked at so far
+    primes: int             # primes found so far
+    fails: int              # counterexamples found so far
+    frontier: int           # next odd number to look at
+    per_second: float       # odd numbers checked per second since the last report
+    elapsed: float          # seconds since the search started
+
+# Instrumentation for the goldbach_fails loops. Pass one as progress= and
+# every interval seconds it builds a ProgressReport, hands it to callback and,
+# with stderr=True, prints a status line there.
+class Progress:
+    def __init__(self, callback: Optional[Callable[[ProgressReport], None]] = None,
+                 interval: float = 1.0, stderr: bool = False):
+        self.callback = callback
+        self.interval = interval
+        self.stderr = stderr
+        self.start = self.last_time = perf_counter()
+        self.last_checked = 0
+        self.last_report = None
+
+    def update(self, checked: int, primes: int, fails: int, frontier: int) -> None:
+        now = perf_counter()
+        if now - self.last_time >= self.interval:
+            self.report(now, checked, primes, fails, frontier)
+
+    # Reports right away, e.g. once the search is done
+    def finish(self, checked: int, primes: int, fails: int, frontier: int) -> None:
+        self.report(perf_counter(), checked, primes, fails, frontier)
+
+    def report(self, now: float, checked: int, primes: int, fails: int, frontier: int) -> None:
+        per_second = (checked - self.last_checked) / max(now - self.last_time, 1e-9)
+        self.last_report = ProgressReport(checked, primes, fails, frontier, per_second, now - self.start)
+        self.last_time, self.last_checked = now, checked
+        if self.callback is not None:
+            self.callback(self.last_report)
+        if self.stderr:
+            r = self.last_report
+            print(f'[{r.elapsed:8.1f}s] frontier {r.frontier}: {r.checked} checked, {r.primes} primes, '
+                  f'{r.fails} fails, {r.per_second:.0f}/s', file=sys.stderr)
@@ -0,0 +1,71 @@
+from array import array
+from itertools import islice, takewhile
+from typing import Callable, Iterable, Iterator, List
+
+# A Haskell-style lazy list over any (possibly infinite) iterator, such as
+# count(3, 2). Elements are only pulled from the iterator when an index, slice,
+# takewhile or `in` needs them, and the realized prefix is cached (in a compact
+# array of machine ints, or a plain list once something does not fit), so
+# every consumer of the same LazyList shares it instead of regenerating it.
+# With increasing=True, `in` stops as soon as the elements pass the value
+# looked for, so it also answers for values not in an infinite list.
+class LazyList:
+    def __init__(self, iterable: Iterable[int], typecode: str = 'q', increasing: bool = False):
+        self.source = iter(iterable)
+        self.cache = array(typecode)
+        self.increasing = increasing
+        self.exhausted = False
+
+    # Realizes elements until n are cached (or the source runs out)
+    def force(self, n: int) -> None:
+        if n <= len(self.cache) or self.exhausted:
+            return
+        chunk = list(islice(self.source, n - len(self.cache)))
+        if len(chunk) < n - len(self.cache):
+            self.exhausted = True
+        before = len(self.cache)
+        try:
+            self.cache.extend(chunk)
+        except (OverflowError, TypeError):
+            self.cache = list(self.cache[:before]) + chunk
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.start or 0, i.stop, i.step or 1
+            if start < 0 or step < 0 or (stop is not None and stop < 0):
+                raise IndexError('LazyList slices cannot count from the end')
+            if stop is None:
+                return LazyList(islice(self, start, None, step), increasing=self.increasing)
+            self.force(stop)
+            return list(self.cache[start:stop:step])
+        if i < 0:
+            raise IndexError('LazyList indices cannot count from the end')
+        self.force(i + 1)
+        if i >= len(self.cache):
+            raise IndexError('LazyList index out of range')
+        return self.cache[i]
+
+    def __iter__(self) -> Iterator[int]:
+        i = 0
+        while True:
+            if i == len(self.cache):
+                self.force(i + 1)
+                if i == len(self.cache):
+                    return
+            yield self.cache[i]
+            i += 1
+
+    def takewhile(self, predicate: Callable[[int], bool]) -> List[int]:
+        return list(takewhile(predicate, self))
+
+    def __contains__(self, x: int) -> bool:
+        for y in self:
+            if y == x:
+                return True
+            if self.increasing and y > x:
+                return False
+        return False
+
+    def __repr__(self) -> str:
+        shown = ', '.join(map(str, self.cache[:10]))
+        return f'LazyList([{shown}{", ..." if len(self.cache) > 10 or not self.exhausted else ""}])'
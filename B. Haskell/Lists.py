@@ -13,3 +13,13 @@ listD = [x for x in range(3,6001,2)]
 # listF = [x for x in takewhile(lambda x: x < 6000, list(count(3,2)))]
 
 print(listC == listD)
+
+# LazyList is the memoized version of [3,5..]: count(3,2) is only forced as
+# far as the takewhile needs, and the realized prefix is kept for later uses.
+from LazyList import LazyList
+
+odds = LazyList(count(3,2), increasing=True)
+
+listG = odds.takewhile(lambda x: x < 6000)
+
+print(listC == listG, 5999 in odds, odds[2999])
@@ -0,0 +1,70 @@
+from argparse import ArgumentParser
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from os.path import abspath, dirname, exists
+import os
+import sys
+from time import time
+from typing import Callable, List, Optional
+
+# PrimeBitset.py lives in the repository root
+sys.path.append(dirname(dirname(abspath(__file__))))
+from PrimeBitset import PrimeBitset, covers, write_bitset
+from PythonVersionB import satisfies_goldbach
+
+# The bitset each worker process maps once, in the pool initializer
+worker_bitset = None
+
+def init_worker(path: str) -> None:
+    global worker_bitset
+    worker_bitset = PrimeBitset(path)
+
+# Worker side: the odd composites in [lo, hi) that are not p + 2k^2
+def block_fails(lo: int, hi: int) -> List[int]:
+    is_prime = worker_bitset.is_prime
+    return [g for g in range(lo | 1, hi, 2) if not is_prime(g) and not satisfies_goldbach(g, is_prime)]
+
+# Finds every counterexample to goldbach's other conjecture below limit by
+# handing blocks of block_size numbers to a process pool. The workers share
+# the prime bitset at bitset_path through the page cache, (re)written first if
+# it is missing or stops short of limit, so every probe is a lookup. Blocks are collected in order, at most two per worker in
+# flight, so the result is the sequential one. progress, if given, is called
+# after each block with the odd numbers checked so far and the rate per second.
+def parallel_goldbach_fails(limit: int, bitset_path: str, block_size: int = 10 ** 6,
+                            workers: Optional[int] = None,
+                            progress: Optional[Callable[[int, float], None]] = None) -> List[int]:
+    if not exists(bitset_path) or covers(bitset_path) < limit - 1:
+        write_bitset(bitset_path, limit)
+    workers = workers or os.cpu_count()
+    fails = []
+    start = time()
+
+    def collect(hi: int, future) -> None:
+        fails.extend(future.result())
+        if progress is not None:
+            checked = (hi - 2) // 2  # odd numbers in [3, hi)
+            progress(checked, checked / max(time() - start, 1e-9))
+
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(bitset_path,)) as pool:
+        pending = deque()
+        for lo in range(3, limit, block_size):
+            hi = min(lo + block_size, limit)
+            pending.append((hi, pool.submit(block_fails, lo, hi)))
+            if len(pending) >= 2 * workers:
+                collect(*pending.popleft())
+        while pending:
+            collect(*pending.popleft())
+    return fails
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description="Search for counterexamples to Goldbach's other conjecture in parallel.")
+    parser.add_argument('limit', type=int, help='search the odd numbers below this')
+    parser.add_argument('bitset', help='prime bitset file to share (written if missing or too small)')
+    parser.add_argument('--block-size', type=int, default=10 ** 6)
+    parser.add_argument('--workers', type=int)
+    args = parser.parse_args()
+
+    def report(checked: int, rate: float) -> None:
+        print(f'{checked} checked, {rate:.0f}/s', file=sys.stderr)
+
+    print("Goldbach failures: ", parallel_goldbach_fails(args.limit, args.bitset, args.block_size, args.workers, report))
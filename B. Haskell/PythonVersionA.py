@@ -1,25 +1,45 @@
-from math import sqrt
+from itertools import count, islice, takewhile
+from math import isqrt
+from typing import Callable, Iterator, Optional
+from os.path import abspath, dirname
+import sys
 from time import time
 
-# Checks if an int is a perfect square by checking if the rounded square root
-# is equivalent to the original int
+# PythonPrimes.py, PrimeStore.py and MillerRabin.py live in the repository root
+sys.path.append(dirname(dirname(abspath(__file__))))
+from MillerRabin import is_prime as miller_rabin
+from PrimeStore import PrimeStore
+from PythonPrimes import WHEEL_PRIMES, wheel
+
+from GoldbachProgress import CHECK_EVERY, Progress
+
+# Past this, Miller-Rabin is faster than trial division and takes over in is_prime
+TRIAL_DIVISION_LIMIT = 10 ** 5
+
+# Checks if an int is a perfect square by checking if the integer square root
+# squared is equivalent to the original int (exact, even for big ints)
 def isASquare(n: int) -> bool:
-    return round(sqrt(n))**2 == n
+    return isqrt(n)**2 == n
 
 # Checks if an int is prime, first by seeing if the int is an even number greater
 # than 2. Otherwise it checks for any odd divisors smaller than the square root
 # of the int. As soon as something evenly divides the int, true is returned
 def is_prime(n: int) -> bool:
+    if n >= TRIAL_DIVISION_LIMIT:
+        return miller_rabin(n)
     if n % 2 == 0 and n > 2:
         return False
-    return all(n % i for i in range(3, int(sqrt(n)) + 1, 2))
+    return all(n % i for i in range(3, isqrt(n) + 1, 2))
 
-# Returns a list of primes ranging from 2 through 6000
-def primes() -> [int]:
-    return [2] + [n for n in range(3, 6000, 2) if is_prime(n)]
+# Returns a list of primes ranging from 2 through 6000. Candidates come from
+# the 2*3*5*7 wheel, so multiples of 3, 5 and 7 are never tested.
+# Every function below takes the primality test as an argument, so a loaded
+# PrimeBitset(path).is_prime can stand in for trial division.
+def primes(is_prime: Callable[[int], bool] = is_prime) -> [int]:
+    return list(WHEEL_PRIMES) + [n for n in takewhile(lambda n: n < 6000, wheel()) if is_prime(n)]
 
 # Returns a list of odd composite numbers between 3 and 6000
-def odd_composites() -> [int]:
+def odd_composites(is_prime: Callable[[int], bool] = is_prime) -> [int]:
     return [n for n in range(3, 6000, 2) if not is_prime(n)]
 
 # Returns whether or not there are any primes that satisfy goldbach's
@@ -27,26 +47,31 @@ def odd_composites() -> [int]:
 def primes_that_satisfy(g: int, primeNumbers: [int]) -> bool:
     return any(p for p in primeNumbers if p < g and isASquare((g-p)//2))
 
-# Maintains a list of ints that disprove goldbach's other conjecture by
-# iterating through odd composite numbers
-# Takes argument for number of fails to include in output list
-def goldbach_fails(n: int) -> [int]:
-    fails = []
-    primeNumbers = primes()
-    oddNotPrimes = odd_composites()
-
-    while len(fails) < n:
-        for g in oddNotPrimes:
-            if not primes_that_satisfy(g, primeNumbers):
-                fails.append(g)
-    return fails
+# Lazily yields, in order, the ints that disprove goldbach's other conjecture
+# by iterating through all odd numbers, like the infinite lists of the Haskell
+# version. Primes go into a PrimeStore as they are found, so there is no 6000
+# ceiling and memory is about a byte per prime below the current number.
+# Take as many fails as wanted with islice. A Progress passed as progress is
+# kept up to date with the search's counters.
+def goldbach_fails(is_prime: Callable[[int], bool] = is_prime,
+                   progress: Optional[Progress] = None) -> Iterator[int]:
+    primeNumbers = PrimeStore([2])
+    fails = 0
+    for g in count(3, 2):
+        if is_prime(g):
+            primeNumbers.append(g)
+        elif not primes_that_satisfy(g, primeNumbers):
+            fails += 1
+            yield g
+        if progress is not None and g % CHECK_EVERY == 1:
+            progress.update((g - 1) // 2, len(primeNumbers), fails, g + 2)
 
 results = 0
 
 
 for _ in range(10):
     start = time()
-    goldbach_fails(2)
+    list(islice(goldbach_fails(), 2))
     end = time()
     results += end - start
 
@@ -1,18 +1,38 @@
-from math import sqrt
+from math import isqrt
+from os.path import abspath, dirname
+import sys
 from time import time
+from typing import Callable, Optional
+
+from GoldbachProgress import CHECK_EVERY, Progress
+
+# MillerRabin.py lives in the repository root
+sys.path.append(dirname(dirname(abspath(__file__))))
+from MillerRabin import is_prime as miller_rabin
+
+# Past this, Miller-Rabin is faster than trial division and takes over in is_prime
+TRIAL_DIVISION_LIMIT = 10 ** 5
 
 def is_a_square(n: int) -> bool:
-        return round(sqrt(n))**2 == n
+        return isqrt(n)**2 == n
 
 def is_prime(n: int) -> bool:
+    if n >= TRIAL_DIVISION_LIMIT:
+        return miller_rabin(n)
     if n % 2 == 0 and n > 2:
         return False
     # Anything with a remainder of 0 will return False
-    return all(n % i for i in range(3, int(sqrt(n)) + 1, 2))
+    return all(n % i for i in range(3, isqrt(n) + 1, 2))
 
-# takes argument for number of fails to include in output list
-def goldbach_fails(bound: int) -> [int]:
-    primes: [int] = [2]
+# takes argument for number of fails to include in output list, and optionally
+# the primality test to use (e.g. PrimeBitset(path).is_prime for a bit probe)
+# and an empty container to collect the primes in (e.g. a PrimeStore, at about
+# a byte per prime instead of a list of ints) and a Progress to report to
+def goldbach_fails(bound: int, is_prime: Callable[[int], bool] = is_prime, primes=None,
+                   progress: Optional[Progress] = None) -> [int]:
+    if primes is None:
+        primes = []
+    primes.append(2)
     oddNumber: int = 3
     fails: [int] = []
 
@@ -27,16 +47,41 @@ def goldbach_fails(bound: int) -> [int]:
             else:
                 fails.append(oddNumber)
         oddNumber += 2
+        if progress is not None and oddNumber % CHECK_EVERY == 1:
+            progress.update((oddNumber - 3) // 2, len(primes), len(fails), oddNumber)
+    if progress is not None:
+        progress.finish((oddNumber - 3) // 2, len(primes), len(fails), oddNumber)
+    return fails
+
+# Checks if g = p + 2k^2 for some prime p and k >= 1 by walking the k with
+# g - 2k^2 >= 3 and probing g - 2k^2 (never 1, which is_prime accepts),
+# instead of walking every prime below g. That is O(sqrt(g)) probes per
+# candidate rather than O(pi(g)), and with a PrimeBitset each probe is a
+# single bit lookup.
+def satisfies_goldbach(g: int, is_prime: Callable[[int], bool] = is_prime) -> bool:
+    return any(is_prime(g - 2*k*k) for k in range(1, isqrt((g - 3) // 2) + 1))
+
+# Same failures as goldbach_fails, found with satisfies_goldbach. No prime list
+# is kept, since the squares are walked instead.
+def goldbach_fails_by_squares(bound: int, is_prime: Callable[[int], bool] = is_prime) -> [int]:
+    oddNumber: int = 3
+    fails: [int] = []
+
+    while len(fails) < bound:
+        if not is_prime(oddNumber) and not satisfies_goldbach(oddNumber, is_prime):
+            fails.append(oddNumber)
+        oddNumber += 2
     return fails
 
-print("Goldbach failures: ", goldbach_fails(2))
+if __name__ == '__main__':
+    print("Goldbach failures: ", goldbach_fails(2))
 
-# Time testing using the average of 10 trials
-results = 0
-for _ in range(10):
-    start = time()
-    goldbach_fails(2)
-    end = time()
-    results += end - start
+    # Time testing using the average of 10 trials
+    results = 0
+    for _ in range(10):
+        start = time()
+        goldbach_fails(2)
+        end = time()
+        results += end - start
 
-print("Average time: ", round(results/10, 3))
+    print("Average time: ", round(results/10, 3))
@@ -0,0 +1,66 @@
+from math import isqrt
+from os.path import abspath, dirname
+import sys
+from time import time
+
+import numpy as np
+
+# PrimesNumpy.py lives in the repository root
+sys.path.append(dirname(dirname(abspath(__file__))))
+from PrimesNumpy import primes_below
+
+# Marks the odd numbers in [lo, hi) that are in sorted (lo odd, index j
+# standing for lo + 2j)
+def mark(lo: int, hi: int, numbers: np.ndarray) -> np.ndarray:
+    marks = np.zeros((hi - lo + 1) // 2, dtype=bool)
+    first, last = np.searchsorted(numbers, [lo, hi])
+    inside = numbers[first:last]
+    marks[(inside[inside % 2 == 1] - lo) // 2] = True
+    return marks
+
+# Marks, for the odd numbers in [lo, hi), which are p + 2k^2 for a prime p and
+# k >= 1. Instead of testing numbers one at a time, for each k the whole slice
+# of primes landing in the block is shifted by 2k^2 and marked at once.
+# primes must hold every prime below hi.
+def representable(lo: int, hi: int, primes: np.ndarray) -> np.ndarray:
+    hits = np.zeros((hi - lo + 1) // 2, dtype=bool)
+    for k in range(1, isqrt((hi - 1) // 2) + 1):
+        shift = 2 * k * k
+        hits |= mark(lo - shift, hi - shift, primes)
+    return hits
+
+# The odd composites in [lo, hi) that are not p + 2k^2
+def block_fails(lo: int, hi: int, primes: np.ndarray) -> np.ndarray:
+    lo |= 1
+    odds = np.arange(lo, hi, 2, dtype=np.int64)
+    return odds[~mark(lo, hi, primes) & ~representable(lo, hi, primes)]
+
+# Same failures as PythonVersionA and PythonVersionB, found a block of
+# block_size numbers at a time. The primes are re-sieved (to twice the block
+# end) only when a block runs past them.
+def goldbach_fails(bound: int, block_size: int = 1 << 16) -> [int]:
+    fails = []
+    primes = primes_below(0)
+    sieved_to = 0
+    lo = 3
+    while len(fails) < bound:
+        hi = lo + block_size
+        if hi > sieved_to:
+            sieved_to = 2 * hi
+            primes = primes_below(sieved_to)
+        fails += block_fails(lo, hi, primes).tolist()
+        lo = hi
+    return fails[:bound]
+
+if __name__ == '__main__':
+    print("Goldbach failures: ", goldbach_fails(2))
+
+    # Time testing using the average of 10 trials
+    results = 0
+    for _ in range(10):
+        start = time()
+        goldbach_fails(2)
+        end = time()
+        results += end - start
+
+    print("Average time: ", round(results/10, 3))
@@ -0,0 +1,61 @@
+from collections import defaultdict
+from math import isqrt
+from os.path import abspath, dirname
+import sys
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+# MillerRabin.py lives in the repository root
+sys.path.append(dirname(dirname(abspath(__file__))))
+from MillerRabin import is_prime
+
+# One variant of goldbach's other conjecture: every odd n is p + a*k^2 for a
+# prime p and k_min <= k (<= k_max, if given). The original is Variant(2, 1).
+class Variant(NamedTuple):
+    a: int
+    k_min: int = 1
+    k_max: Optional[int] = None
+
+# Every shift a*k^2 below limit used by any of the variants, ascending, each
+# with a bitmask of the variants (by position) it belongs to. Built once per
+# search and shared by all of them.
+def shifts(variants: List[Variant], limit: int) -> List[tuple]:
+    masks = defaultdict(int)
+    for i, (a, k_min, k_max) in enumerate(variants):
+        top = isqrt((limit - 1) // a)
+        for k in range(k_min, top + 1 if k_max is None else min(k_max, top) + 1):
+            masks[a * k * k] |= 1 << i
+    return sorted(masks.items())
+
+# Sweeps the odd numbers in [start, limit) once for all variants together and
+# returns, per variant, the numbers that are not p + a*k^2. For each n the
+# shared shifts are tried smallest first; n - s is only probed while some
+# variant using s is still unresolved, and n is done once every variant is.
+# is_prime can be a loaded PrimeBitset's, shared by every variant.
+# With composites_only (the conjecture as stated) primes are skipped.
+def representation_fails(variants: Iterable[Variant], limit: int, start: int = 3,
+                         is_prime: Callable[[int], bool] = is_prime,
+                         composites_only: bool = True) -> Dict[Variant, List[int]]:
+    variants = list(variants)
+    table = shifts(variants, limit)
+    everything = (1 << len(variants)) - 1
+    fails = [[] for _ in variants]
+    for n in range(start | 1, limit, 2):
+        if composites_only and is_prime(n):
+            continue
+        need = everything
+        for s, mask in table:
+            if s > n - 2:
+                break
+            if mask & need and is_prime(n - s):
+                need &= ~mask
+                if not need:
+                    break
+        while need:
+            i = need.bit_length() - 1
+            fails[i].append(n)
+            need &= ~(1 << i)
+    return dict(zip(variants, fails))
+
+if __name__ == '__main__':
+    for variant, failed in representation_fails([Variant(a) for a in (1, 2, 3, 6)], 10000).items():
+        print(variant, failed[:10], f'({len(failed)} below 10000)')
@@ -0,0 +1,84 @@
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+from os.path import abspath, dirname, exists
+import sys
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# PrimeBitset.py and PrimesNumpy.py live in the repository root
+sys.path.append(dirname(dirname(abspath(__file__))))
+from PrimeBitset import HEADER, PrimeBitset, covers, write_bitset
+from PrimesNumpy import primes_below
+
+# The bitset's bytes (as a NumPy view of the memory map) and the small primes
+# tried as p, both set once per worker process by the pool initializer
+worker_bits = None
+worker_primes = None
+
+def init_worker(path: str) -> None:
+    global worker_bits, worker_primes
+    bitset = PrimeBitset(path)
+    worker_bits = np.frombuffer(bitset.bits, dtype=np.uint8, offset=HEADER.size)
+    worker_primes = primes_below(1 << 16)
+
+# Vectorized PrimeBitset.is_prime: one gather and shift for the whole array
+def probe(bits: np.ndarray, m: np.ndarray) -> np.ndarray:
+    odd = (m & 1 == 1) & (m > 1)
+    return (m == 2) | (odd & ((bits[np.where(odd, m >> 4, 0)] >> ((m >> 1) & 7)) & 1 == 1))
+
+# Finds, for every even n in [lo, hi), the smallest prime p with n - p prime.
+# All n of the block are tried against p = 2, 3, 5, ... together, and each
+# round only keeps the n still unresolved, which thin out very fast. Returns
+# the block's counterexamples and its `hardest` (p, n) with the largest p.
+def verify_block(lo: int, hi: int, hardest: int = 10) -> Tuple[List[int], List[Tuple[int, int]]]:
+    global worker_primes
+    n = np.arange(max(lo + lo % 2, 4), hi, 2, dtype=np.int64)
+    smallest = np.zeros(len(n), dtype=np.int64)
+    pending = np.arange(len(n))
+    i = 0
+    while pending.size:
+        if i == len(worker_primes):
+            worker_primes = primes_below(2 * int(worker_primes[-1]))
+        p = int(worker_primes[i])
+        if 2 * p > n[pending[-1]]:
+            break
+        found = probe(worker_bits, n[pending] - p)
+        smallest[pending[found]] = p
+        pending = pending[~found]
+        i += 1
+    counterexamples = n[pending].tolist()
+    top = np.argsort(smallest)[::-1][:hardest]
+    return counterexamples, [(int(smallest[j]), int(n[j])) for j in top if smallest[j]]
+
+# Verifies the strong Goldbach conjecture for the even numbers below limit,
+# block_size numbers per task in a process pool. The workers share the prime
+# bitset at bitset_path, (re)written first if it is missing or stops short of
+# limit, since probe has no fallback past the end of the bitset. Returns the
+# counterexamples and the `hardest` evens whose smallest p is largest, as
+# (p, n) pairs.
+def verify(limit: int, bitset_path: str, block_size: int = 1 << 20,
+           workers: Optional[int] = None, hardest: int = 10) -> Tuple[List[int], List[Tuple[int, int]]]:
+    if not exists(bitset_path) or covers(bitset_path) < limit - 1:
+        write_bitset(bitset_path, limit)
+    counterexamples, top = [], []
+    starts = range(4, limit, block_size)
+    ends = [min(lo + block_size, limit) for lo in starts]
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(bitset_path,)) as pool:
+        for block_counterexamples, block_top in pool.map(verify_block, starts, ends, [hardest] * len(ends)):
+            counterexamples += block_counterexamples
+            top = heapq.nlargest(hardest, top + block_top)
+    return counterexamples, top
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Verify that every even number below LIMIT is a sum of two primes.')
+    parser.add_argument('limit', type=int)
+    parser.add_argument('bitset', help='prime bitset file to share (written if missing or too small)')
+    parser.add_argument('--block-size', type=int, default=1 << 20)
+    parser.add_argument('--workers', type=int)
+    args = parser.parse_args()
+    counterexamples, top = verify(args.limit, args.bitset, args.block_size, args.workers)
+    print("Counterexamples: ", counterexamples)
+    for p, n in top:
+        print(f'{n} = {p} + {n - p}')
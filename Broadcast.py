@@ -0,0 +1,84 @@
+from threading import Condition
+from typing import Iterable, Iterator, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Marks an empty lookahead slot (None is a valid item)
+NOTHING = object()
+
+# Raised when a consumer needs a new item but the slowest consumer is a full
+# buffer behind, so producing it would overwrite an item not yet read.
+class BroadcastOverrun(RuntimeError):
+    pass
+
+# Shared state of a broadcast: one ring buffer of the last size items pulled
+# from the source, and the position of every consumer in the stream. The next
+# item is pulled into a lookahead slot before it goes into the ring, so the end
+# of the source is seen without needing a free slot: a consumer can drain a
+# finite source while another lags a full buffer behind.
+class Broadcaster:
+    def __init__(self, source: Iterable[T], n: int, size: int, block: bool):
+        self.source = iter(source)
+        self.size = size
+        self.block = block
+        self.buffer: List[T] = [None] * size
+        self.produced = 0
+        self.cursors = [0] * n
+        self.attached = [True] * n
+        self.lookahead = NOTHING
+        self.exhausted = False
+        self.lock = Condition()
+
+    def slowest(self) -> int:
+        return min((c for c, a in zip(self.cursors, self.attached) if a), default=self.produced)
+
+    def next(self, i: int) -> T:
+        with self.lock:
+            while self.cursors[i] == self.produced:
+                if self.lookahead is NOTHING:
+                    if self.exhausted:
+                        raise StopIteration
+                    try:
+                        self.lookahead = next(self.source)
+                    except StopIteration:
+                        self.exhausted = True
+                        self.lock.notify_all()
+                        raise
+                if self.produced - self.slowest() < self.size:
+                    self.buffer[self.produced % self.size] = self.lookahead
+                    self.lookahead = NOTHING
+                    self.produced += 1
+                elif self.block:
+                    self.lock.wait()
+                else:
+                    raise BroadcastOverrun(f'consumer {i} is {self.size} items ahead of the slowest consumer')
+            value = self.buffer[self.cursors[i] % self.size]
+            self.cursors[i] += 1
+            self.lock.notify_all()
+            return value
+
+    def detach(self, i: int) -> None:
+        with self.lock:
+            self.attached[i] = False
+            self.lock.notify_all()
+
+# One reader of a broadcast. close() stops it holding back the others.
+class Consumer(Iterator[T]):
+    def __init__(self, broadcaster: Broadcaster, i: int):
+        self.broadcaster = broadcaster
+        self.i = i
+
+    def __next__(self) -> T:
+        return self.broadcaster.next(self.i)
+
+    def close(self) -> None:
+        self.broadcaster.detach(self.i)
+
+# Like itertools.tee, returns n iterators over one source, but the items
+# between the slowest and the fastest consumer live in a ring buffer of fixed
+# size, so memory stays bounded however far the stream runs. When a consumer
+# would get more than size items ahead it raises BroadcastOverrun, or with
+# block=True (consumers in separate threads) it waits for the others.
+def broadcast(iterable: Iterable[T], n: int = 2, size: int = 1024, block: bool = False) -> Tuple[Consumer, ...]:
+    broadcaster = Broadcaster(iterable, n, size, block)
+    return tuple(Consumer(broadcaster, i) for i in range(n))
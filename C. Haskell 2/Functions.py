@@ -1,4 +1,4 @@
-from typing import List, Callable, Any
+from typing import List, Callable, Any, Optional
 import operator, itertools, math
 
 def myZipWith(function: Callable, listA: List, listB: List) -> List:
@@ -40,23 +40,45 @@ print("functionPairsC: ", functionPairsC((lambda x: x + 1), [1,2,3]))
 # While Loops
 
 
-def myWhile(x: Any, boolFunc: Callable, updateFunc: Callable, resultsFunc: Callable) -> Any:
+# The recursive version, closest to Haskell. Python has no tail call
+# elimination, so every iteration adds a stack frame and anything past about
+# 1000 iterations raises RecursionError.
+def myWhileRecursive(x: Any, boolFunc: Callable, updateFunc: Callable, resultsFunc: Callable) -> Any:
     if (boolFunc(x)):
-        return myWhile(updateFunc(x), boolFunc, updateFunc, resultsFunc)
+        return myWhileRecursive(updateFunc(x), boolFunc, updateFunc, resultsFunc)
     else:
         return (resultsFunc(x))
 
+# The same contract run as a loop, in constant stack space. maxIterations, if
+# given, stops a loop that would not end with a RuntimeError. The number of
+# iterations of the last call is left in myWhile.iterations for profiling.
+def myWhile(x: Any, boolFunc: Callable, updateFunc: Callable, resultsFunc: Callable,
+            maxIterations: Optional[int] = None) -> Any:
+    iterations = 0
+    while boolFunc(x):
+        if maxIterations is not None and iterations >= maxIterations:
+            myWhile.iterations = iterations
+            raise RuntimeError(f'myWhile did not finish within {maxIterations} iterations')
+        x = updateFunc(x)
+        iterations += 1
+    myWhile.iterations = iterations
+    return resultsFunc(x)
+
+myWhile.iterations = 0
+
 
 # Squares using while
 
 
+# The update functions append to the end of the list (constant time) rather
+# than inserting at the front, so the results need no reversing and long runs
+# stay linear.
 def updateFunction(x: Any) -> Any:
-    x[1].insert(0, x[0] ** 2)
+    x[1].append(x[0] ** 2)
     x[0] = x[0] + 1
     return x
 
 def returnFunction(x: Any) -> Any:
-    x[1].reverse()
     return x[1]
 
 # The while function takes four arguments: a list of two elements (index, and an empty list), a boolean check function
@@ -71,12 +93,11 @@ print("While loop squares: ", nSquares(10))
 
 
 def updateFunctionMyMap3(x: Any, func: Callable) -> Any:
-    x[1].insert(0, func(x[0]))
+    x[1].append(func(x[0]))
     x[0] = x[0] + 1
     return x
 
 def returnFunctionMyMap3(x: Any) -> Any:
-    x[1].reverse()
     return x[1]
 
 def myMap3(func: Callable, list: List) -> List:
@@ -107,14 +128,13 @@ print("While loop Foldl: ", whileFoldl((lambda x, y: x * y), 1, [1,2,3,4,5]))
 
 def updateFunctionFibs(x: Any) -> Any:
     if (x[0] == 0 or x[0] == 1):
-        x[1].insert(0, 1)
+        x[1].append(1)
     else:
-        x[1].insert(0, (x[1][0] + x[1][1]))
+        x[1].append(x[1][-1] + x[1][-2])
     x[0] = x[0] + 1
     return x
 
 def returnFunctionFibs(x: Any):
-    x[1].reverse()
     return x[1]
 
 def whileFibs(index: int) -> [int]:
@@ -126,16 +146,17 @@ print("While loop Fibonacci: ", whileFibs(10))
 # Primes using while, but not using the Sieve. See CSNS forum for implementation.
 
 
+# Only the primes up to the square root of x[0] need to be tried, and the
+# test stops at the first divisor.
 def updateFunctionPrimes(x: Any) -> Any:
     if x[0] % 2 != 0:
-        if not [p for p in x[1] if x[0] % p == 0]:
-            x[1].insert(0, x[0])
+        if all(x[0] % p for p in itertools.takewhile(lambda p: p * p <= x[0], x[1])):
+            x[1].append(x[0])
 
     x[0] = x[0] + 1
     return x
 
 def returnFunctionPrimes(x: Any) -> Any:
-    x[1].reverse()
     return x[1]
 
 def whilePrimes(index: int) -> [int]:
@@ -1,5 +1,12 @@
-from itertools import count, islice, tee
-from typing import Any, Iterable, Iterator, List, TypeVar
+from collections import defaultdict
+from itertools import count, islice
+from os.path import abspath, dirname
+import sys
+from typing import Any, Iterable, Iterator, List, Optional, TypeVar
+
+# PythonPrimes.py lives in the repository root
+sys.path.append(dirname(dirname(abspath(__file__))))
+from PythonPrimes import WHEEL_MODULUS, WHEEL_PRIMES, WHEEL_RESIDUES, wheel
 T = TypeVar("T")
 
 def take_all_at_once(n: int, iterable: Iterable[T]) -> List[T]:
@@ -12,9 +19,54 @@ def take_one_at_a_time(n: int, iterable: Iterable[T]) -> Iterator[T]:
     result = islice(iterable, n)
     return result
 
+# Observers are told about the sieve's work: each prime found, and each
+# candidate a sieve stage (named by its prime) lets through or blocks. The
+# sieves take observer=None by default and then make no calls at all.
+class SieveObserver:
+    def prime(self, p: int) -> None:
+        pass
+
+    def passes(self, stage: int, n: int) -> None:
+        pass
+
+    def blocks(self, stage: int, n: int) -> None:
+        pass
+
+# Prints every event, like the sieves used to do unconditionally
+class SievePrinter(SieveObserver):
+    def prime(self, p: int) -> None:
+        print("\n{} is prime\n".format(p))
+
+    def passes(self, stage: int, n: int) -> None:
+        print("sieve",stage,'passes',n)
+
+    def blocks(self, stage: int, n: int) -> None:
+        print("sieve",stage,'blocks',n)
+
+# Aggregate mode: counts primes and, per stage, the candidates passed and
+# blocked, to profile where the sieve's work goes without any I/O.
+class SieveCounter(SieveObserver):
+    def __init__(self):
+        self.primes = 0
+        self.stages = defaultdict(lambda: [0, 0])     # stage -> [passes, blocks]
+
+    def prime(self, p: int) -> None:
+        self.primes += 1
+
+    def passes(self, stage: int, n: int) -> None:
+        self.stages[stage][0] += 1
+
+    def blocks(self, stage: int, n: int) -> None:
+        self.stages[stage][1] += 1
+
+    def report(self) -> str:
+        lines = [f'{self.primes} primes', 'stage passes blocks']
+        lines += [f'{k} {p} {b}' for k, (p, b) in sorted(self.stages.items())]
+        return '\n'.join(lines)
+
 z = 0
 
-def sieve(k:int, inp:Iterable[int])->Iterable[int]:
+def sieve(k:int, inp:Iterable[int], observer: Optional[SieveObserver] = None)->Iterable[int]:
 #    print('Initial', k)
 #    p = z
 #    print('Outer P', p)
@@ -26,23 +78,67 @@ def sieve(k:int, inp:Iterable[int])->Iterable[int]:
         n = next(inp)
 #        print(n)
         is_prime = n%k != 0
-        print("sieve",k,'passes' if is_prime else 'blocks', n)
+        if observer is not None:
+            (observer.passes if is_prime else observer.blocks)(k, n)
         if is_prime:
             yield n
 
-def primes() -> Iterable[int]:
-    odd_ints = count(3,2)
+# The original pipeline: every prime found wraps the candidate stream in one
+# more sieve stage, so each candidate passes through as many stages as there
+# are primes below it. Kept to show how the sieve stages behave; it hits the
+# recursion limit after a few hundred primes. With use_wheel, 3, 5 and 7 are
+# yielded up front and the chain only ever sees wheel candidates.
+def sieve_chain_primes(use_wheel: bool = False, observer: Optional[SieveObserver] = None) -> Iterable[int]:
+    if use_wheel:
+        for n in WHEEL_PRIMES[1:]:
+            if observer is not None:
+                observer.prime(n)
+            yield n
+        odd_ints = wheel()
+    else:
+        odd_ints = count(3,2)
     while 1:
         n = next(odd_ints)
-        print("\n{} is prime\n".format(n))
+        if observer is not None:
+            observer.prime(n)
         yield n
-        test, odd_ints = tee(sieve(n,odd_ints))
-#        global z
-#        z += 1
-##        print(next(test))
+        odd_ints = sieve(n,odd_ints,observer)
+
+# Incremental sieve: composites maps the next odd multiple still to be crossed
+# off by each prime found so far to that prime's step (2p, so only odd
+# multiples are visited). A candidate missing from the map is prime; one in the
+# map is composite and its prime moves on to its next free multiple. Each
+# candidate costs O(1) amortized and the map holds one entry per prime found.
+# Candidates are never run past a stage here, so an observer only hears about
+# primes and about composites, blocked by the prime whose multiple they are.
+def primes(use_wheel: bool = False, observer: Optional[SieveObserver] = None) -> Iterable[int]:
+    composites = {}
+    if use_wheel:
+        for n in WHEEL_PRIMES[1:]:
+            if observer is not None:
+                observer.prime(n)
+            yield n
+        candidates = wheel()
+        residues = set(WHEEL_RESIDUES)
+    else:
+        candidates = count(3,2)
+    for n in candidates:
+        step = composites.pop(n, None)
+        if step is None:
+            if observer is not None:
+                observer.prime(n)
+            yield n
+            composites[n * n] = 2 * n
+        else:
+            if observer is not None:
+                observer.blocks(step // 2, n)
+            m = n + step
+            while m in composites or (use_wheel and m % WHEEL_MODULUS not in residues):
+                m += step
+            composites[m] = step
 
-primes_a = take_all_at_once(10, primes())
-primes_b = take_one_at_a_time(10, primes())
+primes_a = take_all_at_once(10, primes(observer=SievePrinter()))
+primes_b = take_one_at_a_time(10, primes(observer=SievePrinter()))
 compare = '==' if primes_a == primes_b else '!='
 print(f'\nprimes_a {compare} primes_b')
 print(f'primes_a: {primes_a}')
@@ -50,7 +146,7 @@ print(f'primes_b: {primes_b}')
 
 # Test statements were ran to check how is both function is running
 
-# The two functions are running in tandem (primes and sieve). Primes is called first and prints out 3 then passes it onto
+# The two functions are running in tandem (sieve_chain_primes and sieve). sieve_chain_primes is called first and prints out 3 then passes it onto
 # sieve function where it is taking in n and the iterable odd_ints. The sieve function will check if the integer
 # n being passed from iterable odd_ints is prime or not. If it is, the print statement will say passes, else it is false.
 # Checks if isPrime true or not and yields n and stops the execution. Once it stops the execution, it moves back into primes and grabs
@@ -0,0 +1,85 @@
+from array import array
+from math import gcd, isqrt
+from random import randrange
+from typing import Iterable, List
+
+from MillerRabin import SMALL_PRIMES, is_prime
+from PythonPrimes import small_odd_primes
+
+# A smallest-prime-factor table: spf[n] is the smallest prime dividing n, for
+# every n up to limit, stored as array('I') (4 bytes an entry). Factoring a
+# number in the table is then a chain of O(log n) lookups and divisions.
+# Numbers past limit are split with Pollard's rho until the parts fit.
+class FactorTable:
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.spf = array('I', range(limit + 1))
+        # Crossing off with the largest primes first lets each smaller prime
+        # overwrite them, so every entry ends on its smallest factor. Each
+        # prime's multiples go in with one C-level slice assignment.
+        for p in reversed([2] + small_odd_primes(isqrt(limit))):
+            self.spf[p * p::p] = array('I', [p]) * ((limit - p * p) // p + 1)
+
+    # Returns the prime factors of n in increasing order, with multiplicity
+    def factorize(self, n: int) -> List[int]:
+        if n < 1:
+            raise ValueError('only positive integers can be factored')
+        if n > self.limit:
+            return sorted(self.split_large(n))
+        factors = []
+        spf = self.spf
+        while n > 1:
+            p = spf[n]
+            factors.append(p)
+            n //= p
+        return factors
+
+    def factorize_many(self, numbers: Iterable[int]) -> List[List[int]]:
+        return [self.factorize(n) for n in numbers]
+
+    # Factors n past the table: strips the small primes, then splits what is
+    # left with Pollard's rho until every part is prime or inside the table.
+    def split_large(self, n: int) -> List[int]:
+        factors = []
+        for p in SMALL_PRIMES:
+            while n % p == 0:
+                factors.append(p)
+                n //= p
+        pending = [n] if n > 1 else []
+        while pending:
+            m = pending.pop()
+            if m <= self.limit:
+                factors += self.factorize(m)
+            elif is_prime(m):
+                factors.append(m)
+            else:
+                d = pollard_rho(m)
+                pending += [d, m // d]
+        return factors
+
+# Returns a non-trivial factor of the odd composite n, using Brent's cycle
+# finding on x -> x*x + c mod n and batching the gcds 128 steps at a time.
+def pollard_rho(n: int) -> int:
+    while True:
+        y, c, m = randrange(1, n), randrange(1, n), 128
+        g, r, q = 1, 1, 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                saved = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                saved = (saved * saved + c) % n
+                g = gcd(abs(x - saved), n)
+        if g != n:
+            return g
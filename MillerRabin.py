@@ -0,0 +1,49 @@
+# Small primes used both to trial-divide candidates before any modular
+# exponentiation and as Miller-Rabin witnesses.
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+
+# Witness sets known to make Miller-Rabin exact below each bound (Jaeschke,
+# Jiang & Deng, Sorenson & Webster). The first one whose bound is above n is
+# used. Above the last bound all of SMALL_PRIMES are used as witnesses and the
+# test is no longer proven exact.
+WITNESSES = (
+    (2047, (2,)),
+    (1373653, (2, 3)),
+    (25326001, (2, 3, 5)),
+    (3215031751, (2, 3, 5, 7)),
+    (2152302898747, (2, 3, 5, 7, 11)),
+    (3474749660383, (2, 3, 5, 7, 11, 13)),
+    (341550071728321, (2, 3, 5, 7, 11, 13, 17)),
+    (3825123056546413051, (2, 3, 5, 7, 11, 13, 17, 19, 23)),
+    (318665857834031151167461, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)),
+    (3317044064679887385961981, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)),
+)
+
+# Checks if an int is prime. Small divisors are ruled out by trial division,
+# then n - 1 = d * 2**s and each witness a must give a**d == 1 or
+# a**(d * 2**r) == -1 (mod n) for some r < s. Exact for every n below
+# 3.3 * 10**24, and a drop-in replacement for the trial division is_prime
+# functions in B. Haskell.
+def is_prime(n: int) -> bool:
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < 100 * 100:
+        return True
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    witnesses = next((w for bound, w in WITNESSES if n < bound), SMALL_PRIMES)
+    for a in witnesses:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
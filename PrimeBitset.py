@@ -0,0 +1,75 @@
+from argparse import ArgumentParser
+from math import isqrt
+import mmap
+import struct
+
+from MillerRabin import is_prime as miller_rabin
+from PythonPrimes import SEGMENT_SIZE, sieve_segment, small_odd_primes
+
+# A bitset file is a 16 byte header (magic, format version, limit N) followed by
+# one bit per odd number: bit k of byte i is set when 2*(8*i + k) + 1 is prime.
+MAGIC = b'PBIT'
+VERSION = 1
+HEADER = struct.Struct('<4sIQ')
+
+# Turns a bytearray of 0/1 flags into packed bits, flag j landing in bit j % 8
+# of byte j // 8. The translate/int round trip keeps the packing in C.
+def pack_bits(flags: bytearray) -> bytes:
+    digits = flags.translate(bytes.maketrans(b'\x00\x01', b'01'))
+    return int(digits[::-1] or b'0', 2).to_bytes((len(flags) + 7) // 8, 'little')
+
+# Writes the odd-only prime bitset for every number up to n to path. The odd
+# numbers are sieved SEGMENT_SIZE at a time (rounded to a multiple of 8, at
+# least 8, so segments pack into whole bytes) and written as they are finished.
+def write_bitset(path: str, n: int, segment_size: int = SEGMENT_SIZE) -> None:
+    segment_size = max(8, segment_size - segment_size % 8)
+    odd_count = (n + 1) // 2                    # odd numbers 1, 3, ..., <= n
+    base = small_odd_primes(isqrt(n))
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, n))
+        for j in range(0, odd_count, segment_size):
+            size = min(segment_size, odd_count - j)
+            f.write(pack_bits(sieve_segment(2 * j + 1, size, base)))
+
+# A read-only, memory-mapped view of a bitset file. Every process that loads
+# the same file shares its pages through the OS page cache, and is_prime is a
+# single bit probe for any n up to limit. Past limit it falls back to
+# Miller-Rabin, so searches can run beyond the table.
+class PrimeBitset:
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self.bits = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.limit = HEADER.unpack_from(self.bits)
+        if magic != MAGIC or version != VERSION:
+            self.bits.close()
+            raise ValueError(f'{path} is not a version {VERSION} prime bitset')
+
+    def is_prime(self, n: int) -> bool:
+        if n > self.limit:
+            return miller_rabin(n)
+        if n % 2 == 0:
+            return n == 2
+        return n > 0 and self.bits[HEADER.size + (n >> 4)] >> ((n >> 1) & 7) & 1 == 1
+
+    __contains__ = is_prime
+
+    def close(self) -> None:
+        self.bits.close()
+
+    def __enter__(self) -> 'PrimeBitset':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+# The largest number the bitset file at path covers
+def covers(path: str) -> int:
+    with PrimeBitset(path) as bitset:
+        return bitset.limit
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Write an odd-only prime bitset for every number up to N.')
+    parser.add_argument('n', type=int, help='largest number covered by the bitset')
+    parser.add_argument('path', help='file to write')
+    args = parser.parse_args()
+    write_bitset(args.path, args.n)
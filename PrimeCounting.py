@@ -0,0 +1,64 @@
+from itertools import compress, islice
+from math import isqrt, log
+
+import numpy as np
+
+from PythonPrimes import SEGMENT_SIZE, segmented_primes, sieve_segment, small_odd_primes
+
+# Counts the primes up to x without listing them (Lucy Hedgehog's variant of
+# Meissel-Lehmer), in O(x**(3/4)) time and O(sqrt(x)) memory. S(v) starts as
+# the count of 2..v for every v of the form x // i, and sieving with each prime
+# p <= sqrt(x) removes the numbers whose smallest factor is p:
+#   S(v) -= S(v // p) - S(p - 1)   for every v >= p*p
+# small[v] holds S(v) for v <= sqrt(x), large[i] holds S(x // i). Each prime's
+# update reads only values from before that update, so it is one NumPy pass.
+def prime_pi(x: int) -> int:
+    if x < 2:
+        return 0
+    r = isqrt(x)
+    small = np.arange(-1, r, dtype=np.int64)
+    small[0] = 0
+    large = np.zeros(r + 1, dtype=np.int64)
+    large[1:] = x // np.arange(1, r + 1, dtype=np.int64) - 1
+    for p in range(2, r + 1):
+        if small[p] == small[p - 1]:
+            continue
+        below_p = small[p - 1]
+        p2 = p * p
+        top = min(r, x // p2)
+        d = np.arange(1, top + 1, dtype=np.int64) * p
+        inner = np.where(d <= r, large[np.minimum(d, r)], small[x // np.maximum(d, r + 1)])
+        large[1:top + 1] -= inner - below_p
+        if p2 <= r:
+            small[p2:] -= small[np.arange(p2, r + 1) // p] - below_p
+    return int(large[1])
+
+# Returns the nth prime (nth_prime(1) == 2). prime_pi is evaluated at the
+# Dusart lower bound n (ln n + ln ln n - 1) and then stepped forward by the
+# prime number theorem while that stays below the target; the remaining gap is
+# sieved in segments and counted.
+def nth_prime(n: int) -> int:
+    if n < 1:
+        raise ValueError('n must be at least 1')
+    if n < 10 ** 4:
+        return next(islice(segmented_primes(), n - 1, None))
+    x = int(n * (log(n) + log(log(n)) - 1))
+    found = prime_pi(x)
+    while n - found > SEGMENT_SIZE:
+        step = int((n - found) * log(x) * 0.9)
+        found_step = prime_pi(x + step)
+        if found_step >= n:
+            break
+        x, found = x + step, found_step
+    lo = x + 1 if x % 2 == 0 else x + 2
+    base_limit = 0
+    while True:
+        if base_limit * base_limit < lo + 2 * SEGMENT_SIZE:
+            base_limit = 2 * isqrt(lo + 2 * SEGMENT_SIZE)
+            base = small_odd_primes(base_limit)
+        segment = sieve_segment(lo, SEGMENT_SIZE, base)
+        here = segment.count(1)
+        if found + here >= n:
+            return next(islice(compress(range(lo, lo + 2 * SEGMENT_SIZE, 2), segment), n - found - 1, None))
+        found += here
+        lo += 2 * SEGMENT_SIZE
@@ -0,0 +1,114 @@
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from typing import Iterable, Optional
+
+from PythonPrimes import primes_between
+
+# Prime pairs counted by their difference (not necessarily consecutive primes)
+PAIRS = {2: 'twin', 4: 'cousin', 6: 'sexy'}
+WIDEST_PAIR = max(PAIRS)
+
+# Single-pass statistics over an increasing stream of primes: gap histogram,
+# maximal gap, twin/cousin/sexy pair counts and the prime races mod 3 and mod 4
+# behind Chebyshev's bias. Memory does not grow with the stream (the histogram
+# has one entry per distinct gap). Besides the counts, only the primes within
+# WIDEST_PAIR of either end are kept, which is what merge needs to join the
+# statistics of two consecutive chunks, so chunks can be counted in parallel.
+class PrimeStats:
+    def __init__(self):
+        self.count = 0
+        self.first = None
+        self.last = None
+        self.gaps = Counter()
+        self.max_gap = 0
+        self.max_gap_start = None
+        self.pairs = dict.fromkeys(PAIRS, 0)
+        self.mod3 = [0] * 3
+        self.mod4 = [0] * 4
+        self.head = []
+        self.tail = []
+
+    def add(self, p: int) -> None:
+        if self.count == 0:
+            self.first = p
+        else:
+            self.add_gap(self.last, p)
+        for q in self.tail:
+            if p - q in self.pairs:
+                self.pairs[p - q] += 1
+        if p < self.first + WIDEST_PAIR:
+            self.head.append(p)
+        self.tail = [q for q in self.tail if q > p - WIDEST_PAIR] + [p]
+        self.mod3[p % 3] += 1
+        self.mod4[p % 4] += 1
+        self.count += 1
+        self.last = p
+
+    def update(self, primes: Iterable[int]) -> 'PrimeStats':
+        for p in primes:
+            self.add(p)
+        return self
+
+    def add_gap(self, p: int, q: int) -> None:
+        gap = q - p
+        self.gaps[gap] += 1
+        if gap > self.max_gap:
+            self.max_gap, self.max_gap_start = gap, p
+
+    # Returns the statistics of this chunk followed by other, a chunk of primes
+    # that all come after this one's
+    def merge(self, other: 'PrimeStats') -> 'PrimeStats':
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return other
+        merged = PrimeStats()
+        merged.count = self.count + other.count
+        merged.first, merged.last = self.first, other.last
+        merged.gaps = self.gaps + other.gaps
+        merged.max_gap, merged.max_gap_start = self.max_gap, self.max_gap_start
+        merged.add_gap(self.last, other.first)
+        if other.max_gap > merged.max_gap:
+            merged.max_gap, merged.max_gap_start = other.max_gap, other.max_gap_start
+        merged.pairs = {d: self.pairs[d] + other.pairs[d] for d in PAIRS}
+        for p in self.tail:
+            for q in other.head:
+                if q - p in merged.pairs:
+                    merged.pairs[q - p] += 1
+        merged.mod3 = [a + b for a, b in zip(self.mod3, other.mod3)]
+        merged.mod4 = [a + b for a, b in zip(self.mod4, other.mod4)]
+        merged.head = [p for p in self.head + other.head if p < merged.first + WIDEST_PAIR]
+        merged.tail = [q for q in self.tail + other.tail if q > merged.last - WIDEST_PAIR]
+        return merged
+
+    __add__ = merge
+
+    def report(self) -> dict:
+        return {
+            'primes': self.count,
+            'first': self.first,
+            'last': self.last,
+            'max_gap': self.max_gap,
+            'max_gap_start': self.max_gap_start,
+            **{PAIRS[d] + '_pairs': n for d, n in self.pairs.items()},
+            'chebyshev_bias_mod3': self.mod3[2] - self.mod3[1],
+            'chebyshev_bias_mod4': self.mod4[3] - self.mod4[1],
+            'gap_histogram': dict(sorted(self.gaps.items())),
+        }
+
+def prime_stats(primes: Iterable[int]) -> PrimeStats:
+    return PrimeStats().update(primes)
+
+# Worker side of parallel_prime_stats
+def block_stats(lo: int, hi: int) -> PrimeStats:
+    return prime_stats(primes_between(lo, hi))
+
+# Statistics of the primes in [a, b), counted in blocks of block_size numbers
+# by a process pool and merged in order
+def parallel_prime_stats(a: int, b: int, block_size: int = 10 ** 7,
+                         workers: Optional[int] = None) -> PrimeStats:
+    starts = range(a, b, block_size)
+    ends = [min(lo + block_size, b) for lo in starts]
+    with ProcessPoolExecutor(workers) as pool:
+        return reduce(PrimeStats.merge, pool.map(block_stats, starts, ends), PrimeStats())
@@ -0,0 +1,91 @@
+from array import array
+from itertools import islice
+from typing import Iterable, Iterator
+
+# Byte that announces a gap too big (or odd) for one byte; the gap follows as
+# 8 little-endian bytes.
+ESCAPE = 0
+
+# A growing, increasing sequence of ints (meant for primes) stored as gaps.
+# Gaps between odd primes are even, so one byte b holds a gap of 2*b up to
+# 510; anything else (the gap from 2 to 3, or a huge gap) is escaped. Every
+# K-th entry's value and byte offset are kept as checkpoints, so indexing
+# decodes at most K gaps. That is about 1 byte a prime, against roughly 36 for
+# a list of Python ints.
+class PrimeStore:
+    def __init__(self, primes: Iterable[int] = (), k: int = 128):
+        self.k = k
+        self.gaps = bytearray()
+        self.checkpoint_values = array('Q')
+        self.checkpoint_offsets = array('Q')
+        self.length = 0
+        self.last = 0
+        self.extend(primes)
+
+    def append(self, p: int) -> None:
+        gap = p - self.last
+        if gap <= 0:
+            raise ValueError(f'{p} is not larger than the last entry {self.last}')
+        if self.length % self.k == 0:
+            self.checkpoint_values.append(p)
+            self.checkpoint_offsets.append(len(self.gaps))
+        if gap % 2 == 0 and gap <= 510:
+            self.gaps.append(gap // 2)
+        else:
+            self.gaps.append(ESCAPE)
+            self.gaps += gap.to_bytes(8, 'little')
+        self.length += 1
+        self.last = p
+
+    # Rebuilds a store from the gap bytes of another one (e.g. saved to disk),
+    # recomputing only its checkpoints
+    @classmethod
+    def from_gaps(cls, gaps: bytes, k: int = 128) -> 'PrimeStore':
+        store = cls(k=k)
+        store.gaps = bytearray(gaps)
+        offset = 0
+        for value in store.decode(0, 0):
+            if store.length % k == 0:
+                store.checkpoint_values.append(value)
+                store.checkpoint_offsets.append(offset)
+            offset += 9 if gaps[offset] == ESCAPE else 1
+            store.length += 1
+            store.last = value
+        return store
+
+    def extend(self, primes: Iterable[int]) -> None:
+        for p in primes:
+            self.append(p)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[int]:
+        return self.decode(0, 0)
+
+    # Decodes entries from byte offset onward, value being the entry before it
+    def decode(self, offset: int, value: int) -> Iterator[int]:
+        gaps = self.gaps
+        end = len(gaps)
+        while offset < end:
+            b = gaps[offset]
+            if b == ESCAPE:
+                value += int.from_bytes(gaps[offset + 1:offset + 9], 'little')
+                offset += 9
+            else:
+                value += 2 * b
+                offset += 1
+            yield value
+
+    def __getitem__(self, i: int) -> int:
+        if i < 0:
+            i += self.length
+        if not 0 <= i < self.length:
+            raise IndexError('PrimeStore index out of range')
+        c, r = divmod(i, self.k)
+        value = self.checkpoint_values[c]
+        if r == 0:
+            return value
+        offset = self.checkpoint_offsets[c]
+        offset += 9 if self.gaps[offset] == ESCAPE else 1
+        return next(islice(self.decode(offset, value), r - 1, None))
@@ -0,0 +1,113 @@
+from argparse import ArgumentParser
+from itertools import islice
+import json
+from math import log
+from time import perf_counter
+import tracemalloc
+from typing import List, Optional
+
+from PythonPrimes import engines, parallel_primes, primes, small_odd_primes
+
+SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+
+# An upper bound for the nth prime (Rosser: p_n < n (ln n + ln ln n) for n >= 6),
+# used to size the reference sieve and the bounded parallel engine.
+def nth_prime_bound(n: int) -> int:
+    return 15 if n < 6 else int(n * (log(n) + log(log(n)))) + 1
+
+# The first n primes from a plain sieve, to check every engine against
+def reference_primes(n: int) -> List[int]:
+    return ([2] + small_odd_primes(nth_prime_bound(n)))[:n]
+
+# Every engine in PythonPrimes.engines, plus the bounded parallel sieve
+def engine_names() -> list:
+    return list(engines) + ['parallel']
+
+def run_engine(name, n: int):
+    if name == 'parallel':
+        return islice(parallel_primes(nth_prime_bound(n)), n)
+    return islice(primes(name), n)
+
+# Times one engine producing its first n primes and checks them against the
+# reference. Peak memory comes from a second, tracemalloc-traced run that
+# consumes the primes without keeping them, so it is the engine's own working
+# memory (for the parallel engine, the parent process only).
+def measure(name, n: int, reference: List[int]) -> dict:
+    start = perf_counter()
+    found = list(run_engine(name, n))
+    seconds = perf_counter() - start
+    tracemalloc.start()
+    for _ in run_engine(name, n):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        'engine': str(name),
+        'primes': n,
+        'seconds': seconds,
+        'primes_per_second': n / seconds if seconds else float('inf'),
+        'peak_bytes': peak,
+        'correct': found == reference,
+    }
+
+# Guesses how long an engine will take for n primes from its earlier runs,
+# using the growth exponent between its last two sizes (clamped to 1..2, and 2
+# when there is only one run, since trial division is quadratic).
+def predicted_seconds(runs: List[dict], n: int) -> float:
+    last = runs[-1]
+    exponent = 2.0
+    if len(runs) > 1 and runs[-2]['seconds'] > 0:
+        exponent = log(last['seconds'] / runs[-2]['seconds']) / log(last['primes'] / runs[-2]['primes'])
+        exponent = min(max(exponent, 1.0), 2.0)
+    return last['seconds'] * (n / last['primes']) ** exponent
+
+# Runs every engine at every size, smallest first. An engine predicted to go
+# past budget seconds at a size is skipped there and at every larger size.
+def benchmark(names: list, sizes: List[int], budget: float) -> List[dict]:
+    results = []
+    for n in sorted(sizes):
+        reference = reference_primes(n)
+        for name in names:
+            runs = [r for r in results if r['engine'] == str(name)]
+            if runs and ('skipped' in runs[-1] or predicted_seconds(runs, n) > budget):
+                results.append({'engine': str(name), 'primes': n, 'skipped': True})
+                continue
+            results.append(measure(name, n, reference))
+    return results
+
+def print_table(results: List[dict], baseline: Optional[List[dict]] = None) -> None:
+    before = {(r['engine'], r['primes']): r for r in baseline or [] if 'skipped' not in r}
+    print(f"{'engine':>10} {'primes':>9} {'seconds':>9} {'primes/s':>11} {'peak KiB':>9} {'correct':>8}"
+          + (f" {'vs base':>8}" if baseline else ''))
+    for r in results:
+        if 'skipped' in r:
+            print(f"{r['engine']:>10} {r['primes']:>9} {'skipped':>9}")
+            continue
+        line = (f"{r['engine']:>10} {r['primes']:>9} {r['seconds']:>9.3f} {r['primes_per_second']:>11.0f}"
+                f" {r['peak_bytes'] / 1024:>9.1f} {'yes' if r['correct'] else 'NO':>8}")
+        old = before.get((r['engine'], r['primes']))
+        if old:
+            line += f" {old['seconds'] / r['seconds']:>7.2f}x"
+        print(line)
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Time and cross-check the prime engines of PythonPrimes.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help='numbers of primes to generate')
+    parser.add_argument('--engines', nargs='+', help='engines to run (default: all)')
+    parser.add_argument('--budget', type=float, default=10.0, help='seconds an engine may take per size')
+    parser.add_argument('--json', help='write the results to this JSON file')
+    parser.add_argument('--baseline', help='JSON results of an earlier run to compare speeds with')
+    args = parser.parse_args()
+
+    names = engine_names()
+    if args.engines:
+        names = [int(e) if e.isdigit() else e for e in args.engines]
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    results = benchmark(names, args.sizes, args.budget)
+    print_table(results, baseline)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
@@ -0,0 +1,42 @@
+from math import isqrt
+from typing import Tuple
+
+import numpy as np
+
+# Odd-only sieve as a boolean array: index j is True when 2*j + 1 is a prime
+# below n. Each prime's multiples are crossed off with one strided slice.
+def odd_sieve(n: int) -> np.ndarray:
+    sieve = np.ones(n // 2, dtype=bool)
+    if sieve.size:
+        sieve[0] = False
+    for j in range(1, (isqrt(n - 1) - 1) // 2 + 1 if n > 1 else 0):
+        if sieve[j]:
+            p = 2 * j + 1
+            sieve[p * p // 2::p] = False
+    return sieve
+
+# Returns the primes below n as an int64 array
+def primes_below(n: int) -> np.ndarray:
+    if n <= 2:
+        return np.empty(0, dtype=np.int64)
+    odd_primes = 2 * np.flatnonzero(odd_sieve(n)).astype(np.int64) + 1
+    return np.concatenate(([2], odd_primes))
+
+# Returns a boolean array saying which candidates are prime, from one sieve up
+# to the largest candidate and a single vectorized lookup.
+def is_prime_mask(candidates) -> np.ndarray:
+    c = np.asarray(candidates, dtype=np.int64)
+    if c.size == 0:
+        return np.zeros(c.shape, dtype=bool)
+    sieve = odd_sieve(max(int(c.max()) + 1, 0))
+    odd = (c % 2 == 1) & (c > 1)
+    mask = c == 2
+    mask[odd] = sieve[c[odd] // 2]
+    return mask
+
+# Splits the odd numbers in [3, n) into their primes and their composites with
+# one primality mask, e.g. the primes() and odd_composites() of PythonVersionA.
+def split_odds(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    odds = np.arange(3, max(n, 3), 2, dtype=np.int64)
+    mask = is_prime_mask(odds)
+    return odds[mask], odds[~mask]
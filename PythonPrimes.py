@@ -1,9 +1,53 @@
-from itertools import count
+from array import array
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count, compress
+from math import gcd, isqrt
+import os
+from typing import Iterator, Optional
 
-def primes(i):
-    primes_cache = []
-    yield 2
-    for k in count(3, 2):
+# Number of odd candidates sieved per segment. One byte per candidate keeps a
+# segment (32 KiB) inside a typical L1/L2 cache.
+SEGMENT_SIZE = 1 << 15
+
+# Number of odd candidates handed to a worker process at a time by the parallel
+# sieve. Large enough that sending the block's primes back costs little next to
+# sieving it; each worker still sieves it SEGMENT_SIZE at a time.
+BLOCK_SIZE = 1 << 21
+
+# A 2*3*5*7 wheel: of every 210 consecutive integers only the 48 coprime to 210
+# can be prime (other than 2, 3, 5 and 7 themselves).
+WHEEL_PRIMES = (2, 3, 5, 7)
+WHEEL_MODULUS = 210
+WHEEL_RESIDUES = [r for r in range(1, WHEEL_MODULUS) if gcd(r, WHEEL_MODULUS) == 1]
+
+# Yields, in order and forever, the integers >= start that are coprime to 210.
+# With the default start these are the prime candidates after 7.
+def wheel(start: int = 11) -> Iterator[int]:
+    base, r = divmod(start, WHEEL_MODULUS)
+    base *= WHEEL_MODULUS
+    i = bisect_left(WHEEL_RESIDUES, r)
+    while True:
+        for r in WHEEL_RESIDUES[i:]:
+            yield base + r
+        base += WHEEL_MODULUS
+        i = 0
+
+# With use_wheel the candidates come from the wheel instead of every odd number,
+# so multiples of 3, 5 and 7 are never tested against primes_cache. Any empty
+# container with append and iteration can be passed in as primes_cache, e.g. a
+# PrimeStore to keep the cache at about a byte per prime.
+def trial_division_primes(i: int, use_wheel: bool = False, primes_cache=None) -> Iterator[int]:
+    if primes_cache is None:
+        primes_cache = []
+    if use_wheel:
+        yield from WHEEL_PRIMES
+        candidates = wheel()
+    else:
+        yield 2
+        candidates = count(3, 2)
+    for k in candidates:
         no_divisors = not any(p for p in primes_cache if k % p == 0)      if i == 0 else \
                       not [p for p in primes_cache if k % p == 0]         if i == 1 else \
                       all(p for p in primes_cache if k % p != 0)          if i == 2 else \
@@ -13,8 +57,138 @@ def primes(i):
             primes_cache.append(k)
             yield k
 
-for i in range(5):
-    print(i, [p for (_, p) in zip(range(12), primes(i))])
+# Returns the odd primes up to n with a plain (unsegmented) sieve. Used for the
+# base primes of the segmented sieve, which never need to go past sqrt of the
+# current segment end.
+def small_odd_primes(n: int) -> [int]:
+    if n < 3:
+        return []
+    sieve = bytearray(b'\x01') * ((n - 1) // 2 + 1)     # index j stands for 2*j + 1
+    sieve[0] = 0
+    for j in range(1, (isqrt(n) - 1) // 2 + 1):
+        if sieve[j]:
+            p = 2 * j + 1
+            sieve[p * p // 2::p] = bytes((len(sieve) - 1 - p * p // 2) // p + 1)
+    return [2 * j + 1 for j in compress(range(len(sieve)), sieve)]
+
+# Sieves one segment of odd numbers: index j of the returned bytearray stands
+# for lo + 2*j (lo odd) and is 1 when that number is prime. base must hold the
+# odd primes up to sqrt of the segment end.
+def sieve_segment(lo: int, size: int, base: [int]) -> bytearray:
+    hi = lo + 2 * size
+    segment = bytearray(b'\x01') * size
+    for p in base:
+        if p * p >= hi:
+            break
+        start = max(p * p, (lo + p - 1) // p * p)
+        if start % 2 == 0:
+            start += p
+        j = (start - lo) // 2
+        if j < size:
+            segment[j::p] = bytes((size - 1 - j) // p + 1)
+    if lo == 1 and size:
+        segment[0] = 0
+    return segment
+
+# Sieves the odd numbers one bytearray segment at a time. The base primes are
+# recomputed (doubling their bound) only when sqrt of the segment end passes
+# it, so memory stays at one segment plus the base primes up to sqrt of the
+# segment end.
+def segmented_primes(segment_size: int = SEGMENT_SIZE) -> Iterator[int]:
+    yield 2
+    base_limit = 0
+    for lo in count(3, 2 * segment_size):
+        hi = lo + 2 * segment_size
+        if base_limit * base_limit < hi:
+            base_limit = max(2 * base_limit, isqrt(hi) + 1)
+            base = small_odd_primes(base_limit)
+        yield from compress(range(lo, hi, 2), sieve_segment(lo, segment_size, base))
+
+# Yields the primes p with a <= p < b, sieving only that window. The base
+# primes go up to sqrt(b), and the window is sieved in segments of at least
+# sqrt(b) odd numbers so the per-prime cost of each segment is amortized.
+def primes_between(a: int, b: int) -> Iterator[int]:
+    if a <= 2 < b:
+        yield 2
+    lo = max(a, 3) | 1
+    if lo >= b:
+        return
+    base = small_odd_primes(isqrt(b - 1))
+    size = max(SEGMENT_SIZE, isqrt(b))
+    for seg_lo in range(lo, b, 2 * size):
+        seg_size = min(size, (b - seg_lo + 1) // 2)
+        yield from compress(range(seg_lo, seg_lo + 2 * seg_size, 2), sieve_segment(seg_lo, seg_size, base))
+
+# Same as primes_between, but returns the primes as one array('Q')
+def primes_between_array(a: int, b: int) -> array:
+    return array('Q', primes_between(a, b))
+
+# Base primes of the worker processes, set once per process by the pool
+# initializer rather than sent with every block.
+worker_base = []
+
+def init_worker(base: [int]) -> None:
+    global worker_base
+    worker_base = base
+
+# Worker side of parallel_primes: sieves the size odd numbers from lo (stopping
+# before bound) and returns their primes as a compact array.
+def sieve_block(lo: int, size: int, bound: int, segment_size: int) -> array:
+    found = array('Q')
+    for seg_lo in range(lo, min(lo + 2 * size, bound), 2 * segment_size):
+        seg_size = min(segment_size, (lo + 2 * size - seg_lo) // 2, (bound - seg_lo + 1) // 2)
+        segment = sieve_segment(seg_lo, seg_size, worker_base)
+        found.extend(compress(range(seg_lo, seg_lo + 2 * seg_size, 2), segment))
+    return found
+
+# Yields the primes below bound in order, sieving disjoint blocks of odd numbers
+# in a pool of worker processes. At most two blocks per worker are in flight,
+# so results are merged in block order without buffering the whole range.
+def parallel_primes(bound: int, block_size: int = BLOCK_SIZE,
+                    segment_size: int = SEGMENT_SIZE,
+                    workers: Optional[int] = None) -> Iterator[int]:
+    for block in parallel_prime_blocks(bound, block_size, segment_size, workers):
+        yield from block
+
+# Same as parallel_primes, but returns all the primes as one array('Q').
+def parallel_primes_array(bound: int, block_size: int = BLOCK_SIZE,
+                          segment_size: int = SEGMENT_SIZE,
+                          workers: Optional[int] = None) -> array:
+    found = array('Q')
+    for block in parallel_prime_blocks(bound, block_size, segment_size, workers):
+        found.extend(block)
+    return found
+
+def parallel_prime_blocks(bound: int, block_size: int, segment_size: int,
+                          workers: Optional[int]) -> Iterator[array]:
+    if bound <= 2:
+        return
+    yield array('Q', [2])
+    workers = workers or os.cpu_count()
+    base = small_odd_primes(isqrt(bound))
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(base,)) as pool:
+        pending = deque()
+        for lo in range(3, bound, 2 * block_size):
+            pending.append(pool.submit(sieve_block, lo, block_size, bound, segment_size))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+# Every prime engine by name. Variants 0-4 are the trial division versions
+# explained at the bottom of this file, kept for comparison.
+engines = {
+    'segmented': segmented_primes,
+    'wheel': lambda: trial_division_primes(3, use_wheel=True),
+    **{i: (lambda i=i: trial_division_primes(i)) for i in range(5)},
+}
+
+def primes(i='segmented') -> Iterator[int]:
+    return engines[i]()
+
+if __name__ == '__main__':
+    for i in engines:
+        print(i, [p for (_, p) in zip(range(12), primes(i))])
 
 
 